@@ -1,18 +1,99 @@
 import os
 import re
 import csv
+import atexit
 import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
 from datetime import datetime
-from jira import JIRA
+from dataclasses import dataclass
+from jira import JIRA, JIRAError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, List
-from markdown_cleaner import markdown_to_dict
+from markdown_cleaner import markdown_to_dict, clean_child_name
 import json
 import argparse
+from bisect import bisect_left
+from itertools import chain
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the standard json module is used without it
+    orjson = None
 
 # Initializing Environment variables loader
 load_dotenv()
 
+# Patterns used while parsing Notion exports, compiled once at import
+_CHILD_RE = re.compile(r'([^(]+)\s?\(([^)]+)\.md\)')
+_FILE_ID_RE = re.compile(r'\s[a-f0-9]{16,}$')
+_ID_RE = re.compile(r'\s([a-f0-9]{16,})$')
+_REPORTER_RE = re.compile(r"Created by:\s*(.*)", re.IGNORECASE)
+_ASSIGNEE_RE = re.compile(r"Assignee:\s*(.*)", re.IGNORECASE)
+
+# Characters dropped from task names before matching them, applied in one str.translate pass
+_NORMALIZE_TABLE = str.maketrans({":": None})
+
+# Notion priorities mapped to Jira default priorities
+PRIORITY_MAPPING = {
+    "P0-Blocker": "Highest",
+    "P1-Critical": "High",
+    "P2-High": "Medium",
+    "P3-Normal": "Low",
+    "P4-Minor": "Lowest"
+}
+
+# Notion item types (lowercase) mapped to Jira issue types, anything else becomes a Task
+ITEM_TYPE_MAPPING = {
+    "user story": "Story",
+    "story": "Story",
+    "bug": "Bug",
+    "bugs": "Bug"
+}
+
+# Concurrent requests issued against Jira for independent calls (e.g. transitions)
+JIRA_MAX_WORKERS = 8
+# Issues sent per bulk create request, larger payloads tend to time out
+JIRA_BULK_CREATE_LIMIT = 50
+# Seconds a partially filled create_issue_batched queue waits before it is sent
+JIRA_BATCH_MAX_WAIT = 0.5
+# Pooled HTTP connections kept per Jira host, leaves headroom over JIRA_MAX_WORKERS
+JIRA_POOL_SIZE = 32
+
+# Fallback descriptions for issues whose Notion page has no description
+DEFAULT_EPIC_DESC = 'Epic created from Notion'
+DEFAULT_TASK_DESC = 'Task created from Notion'
+DEFAULT_SUBTASK_DESC = 'Sub-task created from Notion'
+
+# Issue type fields shared by the issue payloads instead of being rebuilt per issue
+ISSUE_TYPE_FIELDS = {name: {'name': name} for name in ("Epic", "Story", "Task", "Bug", "Sub-task")}
+SUBTASK_TYPE_FIELD = ISSUE_TYPE_FIELDS["Sub-task"]
+
+# Notion truncates exported filenames, only this many leading chars of a task name are reliable
+ITEM_PREFIX_LENGTH = 35
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Jira settings read from the environment (.env) once per run"""
+    jira_server_url: Optional[str]
+    jira_username: Optional[str]
+    jira_token: Optional[str]
+    jira_project_key: Optional[str]
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            jira_server_url=os.getenv("JIRA_SERVER_URL"),
+            jira_username=os.getenv("JIRA_USERNAME"),
+            jira_token=os.getenv("JIRA_TOKEN"),
+            jira_project_key=os.getenv("JIRA_PROJECT_KEY"),
+        )
+
 # Configure logging
 def setup_logging():
     # Create logs directory if it doesn't exist
@@ -22,19 +103,27 @@ def setup_logging():
     # Generate log filename with timestamp
     log_filename = os.path.join(log_dir, f'notion_to_jira_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
     
+    # Records are only enqueued on the calling thread, a background listener
+    # formats them and writes to the file and console
+    log_queue = queue.Queue(-1)
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_filename)
+    stream_handler = logging.StreamHandler()  # Also output to console
+    file_handler.setFormatter(formatter)
+    stream_handler.setFormatter(formatter)
+    listener = QueueListener(log_queue, file_handler, stream_handler)
+
     # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_filename),
-            logging.StreamHandler()  # Also output to console
-        ]
-    )
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener.start()
+    # Flush records still queued when the process exits, however it exits
+    atexit.register(listener.stop)
     return logging.getLogger(__name__)
 
-# Global logger object
-logger = setup_logging()
+# Module logger, handlers are attached by setup_logging when the script runs
+logger = logging.getLogger(__name__)
 
 class HierarchicalDataParser:
     def __init__(self, root_dir):
@@ -48,109 +137,112 @@ class HierarchicalDataParser:
         self.items_dir = os.path.join(root_dir, "Items")
         self.users_file = os.path.join(root_dir, "users.json")
         self.status_file = os.path.join(root_dir, "status.json")
+        # Load the mapping files once, lookups happen for every parsed row
+        self._users = self.load_mapping(self.users_file)
+        self._status = self.load_mapping(self.status_file, required=True)
+        # Parsed Items markdown keyed by path, tasks sharing a truncated name resolve to the same file
+        self._item_cache = {}
+
+    def load_mapping(self, filepath, required=False):
+        """
+        Load a JSON mapping file
+        Args:
+            filepath (str): Path of the mapping file
+            required (bool): Raise FileNotFoundError instead of falling back to an empty mapping
+        Returns:
+            dict: The mapping, empty when an optional file is missing
+        """
+        try:
+            with open(filepath, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            if required:
+                raise
+            logger.warning(f"Mapping file {filepath} not found, names are used as they appear in Notion.")
+            return {}
 
     def process_user_email(self, name):
-        if not name or name == "":
-            return ""
-        with open(self.users_file, "r", encoding="utf-8") as file:
-            users = json.load(file)
-            return users.get(name, name)
+        return self._users.get(name, name) if name else ""
         
     def process_task_status(self, status):
-        if not status or status == "":
-            status = "backlog"
-        with open(self.status_file, "r", encoding="utf-8") as file:
-            status_mapping = json.load(file)
-            return status_mapping.get(status)
+        return self._status.get(status or "backlog")
 
     def process_child_tasks(self, text):
-        cl_pattern = r'([^(]+)\s?\(([^)]+)\.md\)'
         result = {}
-        for match in re.findall(cl_pattern, text):
-            # Clean the name by replacing '%20' with space and normalizing it
-            name = self.normalize_task_name(match[0].strip().replace('%20', ' ').lstrip(", "))
-            # Extract the ID (last 32 chars)
-            id_ = match[1][-32:]
-            result[id_] = name
-        
+        for match in _CHILD_RE.finditer(text):
+            # Extract the ID (last 32 chars) and the cleaned, normalized name
+            result[match.group(2)[-32:]] = self.normalize_task_name(clean_child_name(match.group(1)))
         return result
 
     # Function to read markdown file and select
     def read_markdown(self, filepath):
-        with open(filepath, "r", encoding="utf-8-sig") as file:
-            return file.read()
+        return Path(filepath).read_bytes().decode("utf-8-sig")
 
     # Function to clean filenames by removing trailing alphanumeric ID
     def clean_filename(self, filename):
-        return re.sub(r'\s[a-f0-9]{16,}$', '', filename)
+        return _FILE_ID_RE.sub('', filename)
 
     def normalize_task_name(self, name):
         """Normalize task name by removing only colons (:)"""
-        return name.replace(":", "").strip()
+        return name.translate(_NORMALIZE_TABLE).strip()
 
     # Function to extract the ID from a filename
     def extract_id(self, filename):
-        match = re.search(r'\s([a-f0-9]{16,})$', filename)
+        match = _ID_RE.search(filename)
         return match.group(1) if match else None
 
     # Function to extract reporter from markdown file (assuming first line contains "Created by:")
     def extract_reporter(self, md_content):
-        match = re.search(r"Created by:\s*(.*)", md_content, re.IGNORECASE)
-        return match.group(1).strip() if match else "Unknown"
+        match = _REPORTER_RE.search(md_content)
+        return match.group(1).strip() if match else ""
     
     def extract_assignee(self, md_content):
-        match = re.search(r"Assignee:\s*(.*)", md_content, re.IGNORECASE)
-        return match.group(1).strip() if match else "Unknown"
+        match = _ASSIGNEE_RE.search(md_content)
+        return match.group(1).strip() if match else ""
         
     # Function to read CSV file and extract task details
     def read_csv(self, filepath):
         tasks = []
         with open(filepath, "r", encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file)
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return tasks
+            # Resolve column positions once per file instead of building a dict per row
+            columns = {name: index for index, name in enumerate(header)}
+
+            def cell(row, column):
+                index = columns.get(column)
+                return row[index].strip() if index is not None and index < len(row) else ""
+
             for row in reader:
-                task_name = row.get("Task name", "").strip()
-                task_id = row.get("ID", "").strip()
-                reported_by = self.process_user_email(row.get("Reported By", "").strip())
-                assignee = self.process_user_email(row.get("Assignee", "").strip())
-                short_description = row.get("Short Description", "").strip()
-
-                status = row.get("Status", "").strip()
-                status = self.process_task_status(status.lower())
-
-                priority = row.get("Priority", "").strip()
-                priority_mapping = {
-                    "P0-Blocker": "Highest",  # Jira default: "Highest"
-                    "P1-Critical": "High",    # Jira default: "High"
-                    "P2-High": "Medium",      # Jira default: "Medium"
-                    "P3-Normal": "Low",       # Jira default: "Low"
-                    "P4-Minor": "Lowest"      # Jira default: "Lowest"
-                }
-                priority = priority_mapping.get(priority, "Medium") if priority else "Medium"
-                
-                child_tasks = row.get("Child Tasks", "").strip()
+                # Skip blank lines like csv.DictReader does
+                if not row:
+                    continue
+                task_name = cell(row, "Task name")
+                reported_by = self.process_user_email(cell(row, "Reported By"))
+                assignee = self.process_user_email(cell(row, "Assignee"))
+                status = self.process_task_status(cell(row, "Status").lower())
+                priority = PRIORITY_MAPPING.get(cell(row, "Priority"), "Medium")
+
+                child_tasks = cell(row, "Child Tasks")
                 child_tasks = self.process_child_tasks(child_tasks) if child_tasks else {}
 
-                story_points = row.get("# Story Points", "").strip()
+                story_points = cell(row, "# Story Points")
                 story_points = float(story_points) if story_points else None
-                
-                item_type = row.get("Type", "").strip()
-                if item_type.lower() == "user story" or item_type.lower() == "story":
-                    item_type = "Story"
-                elif item_type.lower() == "bug" or item_type.lower() == "bugs":
-                    item_type = "Bug"
-                else:
-                    item_type = "Task"
+
+                item_type = ITEM_TYPE_MAPPING.get(cell(row, "Type").lower(), "Task")
 
                 logger.info(f"Item {task_name} of type {item_type} found from Notion Exports.")
                 tasks.append({
-                    "id": task_id,
+                    "id": cell(row, "ID"),
                     "summary": self.clean_filename(task_name),
                     "type": item_type,
                     "reported_by": reported_by,
                     "assignee": assignee,
                     "story_points": story_points,
                     "description": "",  # Will be filled from task markdown file,
-                    "short_description": short_description,
+                    "short_description": cell(row, "Short Description"),
                     "child_items": child_tasks,
                     "priority": priority,
                     "status": status
@@ -158,106 +250,132 @@ class HierarchicalDataParser:
 
         return tasks
 
+    def index_item_files(self):
+        """
+        Sorted (lowercase filename, filename) pairs of the markdown files in Items,
+        so task names can be matched by binary searching their prefix.
+        """
+        with os.scandir(self.items_dir) as entries:
+            return sorted(
+                (entry.name.lower(), entry.name)
+                for entry in entries
+                if entry.name.endswith(".md") and entry.is_file()
+            )
+
+    def find_item_file(self, items_index, task_name):
+        """Return the first Items markdown file starting with the (truncated) task name"""
+        prefix = task_name[:ITEM_PREFIX_LENGTH].lower()
+        if not prefix:
+            return None
+        position = bisect_left(items_index, (prefix,))
+        if position < len(items_index) and items_index[position][0].startswith(prefix):
+            return items_index[position][1]
+        return None
+
+    def parse_item_file(self, task_path):
+        """Parse an Items markdown file once and reuse the result for later matches"""
+        task_markdown = self._item_cache.get(task_path)
+        if task_markdown is None:
+            task_markdown = self._item_cache[task_path] = markdown_to_dict(task_path)
+        return task_markdown
+
+    def process_epic(self, epic_entry, items_index):
+        """
+        Build the Epic dictionary for a single Epic markdown file.
+        Args:
+            epic_entry (os.DirEntry): Epic markdown file inside the Epics directory
+            items_index (list): Sorted item filenames from index_item_files
+        """
+        epic_summary = self.clean_filename(os.path.splitext(epic_entry.name)[0])  # Clean filename
+        epic_content = self.read_markdown(epic_entry.path)  # Read markdown content
+        epic_reporter = self.process_user_email(self.extract_reporter(epic_content))  # Extract Created by
+        epic_assignee = self.process_user_email(self.extract_assignee(epic_content))  # Extract Assignee
+        logger.info(f"Epic {epic_summary} found from Notion Exports.")
+        # Create Epic dictionary
+        epic_data = {
+            "summary": epic_summary,
+            "description": epic_content,
+            "type": "Epic",
+            "reported_by": epic_reporter,
+            "assignee": epic_assignee,
+            "items": [],
+        }
+
+        # Find associated CSV file (Tasks.csv)
+        epic_folder_path = epic_entry.path[:-3]
+        if os.path.isdir(epic_folder_path):
+            with os.scandir(epic_folder_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".csv") and entry.is_file():  # Read all CSV files
+                        epic_data["items"].extend(self.read_csv(entry.path))
+                        logger.info(f"Items for Epic {epic_summary} found from Notion Exports.")
+
+        # Read task descriptions from markdown files inside src/Tasks
+        for task in epic_data["items"]:
+            task_file = self.find_item_file(items_index, task["summary"])
+            if task_file:
+                logger.info(f"Looking for Task: '{task['summary']}' in File: '{task_file}'")
+                task_path = os.path.join(self.items_dir, task_file)
+                task_markdown = self.parse_item_file(task_path)
+                task["description"] = task_markdown.get("description")
+                if isinstance(task["child_items"], str) and task["child_items"] == "":
+                    task["child_items"] = {}
+                task["child_items"].update(task_markdown.get("properties", {}).get("Child Tasks", {}))
+        return epic_data
+
     def process_notion_data(self):
-        epics = []
-
-        # Traverse the Epics directory
-        for epic_file in os.listdir(self.epics_dir):
-            if epic_file.endswith(".md"):  # Identify markdown files (Epics)
-                epic_path = os.path.join(self.epics_dir, epic_file)
-                epic_summary = self.clean_filename(os.path.splitext(epic_file)[0])  # Clean filename
-                epic_content = self.read_markdown(epic_path)  # Read markdown content
-                epic_reporter = self.process_user_email(self.extract_reporter(epic_content))  # Extract Created by
-                epic_assignee = self.process_user_email(self.extract_assignee(epic_content))  # Extract Assignee
-                logger.info(f"Epic {epic_summary} found from Notion Exports.")
-                # Create Epic dictionary
-                epic_data = {
-                    "summary": epic_summary,
-                    "description": epic_content,
-                    "type": "Epic",
-                    "reported_by": epic_reporter,
-                    "assignee": epic_assignee,
-                    "items": [],
-                }
+        # Item filenames are matched against task summaries, list the folder only once
+        items_index = self.index_item_files()
 
-                # Find associated CSV file (Tasks.csv)
-                epic_folder_path = os.path.join(self.epics_dir, epic_file[:-3])
-                if os.path.exists(epic_folder_path) and os.path.isdir(epic_folder_path):
-                    for file in os.listdir(epic_folder_path):
-                        if file.endswith(".csv"):  # Read all CSV files
-                            csv_path = os.path.join(epic_folder_path, file)
-                            epic_data["items"].extend(self.read_csv(csv_path))
-                            logger.info(f"Items for Epic {epic_summary} found from Notion Exports.")
-
-                # Read task descriptions from markdown files inside src/Tasks
-                for task in epic_data["items"]:
-                    for task_file in os.listdir(self.items_dir):
-                        file_compare_str = task["summary"] if len(task["summary"]) < 35 else task["summary"][:35]
-                        if task_file.endswith(".md") and task_file.lower().startswith(file_compare_str.lower()):
-                            logger.info(f"Looking for Task: '{task["summary"]}' in File: '{task_file}'")
-                            task_path = os.path.join(self.items_dir, task_file)
-                            task["description"] = markdown_to_dict(task_path).get("description")
-                            if isinstance(task["child_items"], str) and task["child_items"] == "":
-                                task["child_items"] = {}
-                            task["child_items"].update(markdown_to_dict(task_path).get("properties", {}).get("Child Tasks", {}))
-                            break
-                # Add Epic to the list
-                epics.append(epic_data)
+        # Traverse the Epics directory, every Epic only reads its own files so they are parsed concurrently
+        with os.scandir(self.epics_dir) as entries:
+            epic_entries = [entry for entry in entries if entry.name.endswith(".md") and entry.is_file()]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            epics = list(executor.map(lambda epic_entry: self.process_epic(epic_entry, items_index), epic_entries))
 
         return epics
 
     def reorganize_epic_tasks(self, epics: List[Dict]) -> List[Dict]:
-        processed_epics = []
+        """Nest matched child tasks under their parents, Epics are updated in place and returned"""
+        normalize = self.normalize_task_name
         
         for epic in epics:
-            items = epic.get('items', [])
-            stories = [item for item in items if item['type'] == 'Story']
-            tasks = [item for item in items if item['type'] == 'Task']
+            # Partition items in a single pass, other types (e.g. Bug) are not migrated
+            stories = []
+            tasks = []
+            for item in epic.get('items', []):
+                if item['type'] == 'Story':
+                    stories.append(item)
+                elif item['type'] == 'Task':
+                    tasks.append(item)
 
             # Normalize task summaries for accurate matching
-            task_map = {self.normalize_task_name(task['summary']): task for task in tasks}
-            standalone_tasks = []
-
-            # First pass: attach tasks to their correct parents (Story or Task)
-            for task in tasks:
-                if isinstance(task['child_items'], dict):
-                    new_child_items = {}
-
-                    for key, child_task_name in task['child_items'].items():
-                        normalized_name = self.normalize_task_name(child_task_name)
-                        if normalized_name in task_map:
-                            child_task = task_map.pop(normalized_name)  # Remove to prevent duplicates
-                            new_child_items[child_task['id']] = child_task
-                        else:
-                            new_child_items[key] = child_task_name  # Retain unmatched names
-                    
-                    task['child_items'] = new_child_items  # Update child items
-
-            # Second pass: Attach tasks to Stories
-            for story in stories:
-                if not isinstance(story['child_items'], dict):
-                    story['child_items'] = {}
+            task_map = {normalize(task['summary']): task for task in tasks}
+
+            # Single pass over the parents: Tasks claim their sub-tasks first, then Stories
+            # attach whatever is still unclaimed
+            for parent in chain(tasks, stories):
+                if not isinstance(parent['child_items'], dict):
+                    parent['child_items'] = {}
 
                 new_child_items = {}
 
-                for key, child_task_name in story['child_items'].items():
-                    normalized_name = self.normalize_task_name(child_task_name)
+                for key, child_task_name in parent['child_items'].items():
+                    normalized_name = normalize(child_task_name)
                     if normalized_name in task_map:
-                        story_task = task_map.pop(normalized_name)  # Remove to prevent duplicate processing
-                        new_child_items[story_task['id']] = story_task
+                        child_task = task_map.pop(normalized_name)  # Remove to prevent duplicates
+                        new_child_items[child_task['id']] = child_task
                     else:
-                        new_child_items[key] = child_task_name  # Retain unmatched items
-
-                story['child_items'] = new_child_items  # Update story child_items
+                        new_child_items[key] = child_task_name  # Retain unmatched names
 
-            # Any remaining tasks that weren't matched to a Story stay standalone
-            standalone_tasks.extend(task_map.values())
+                parent['child_items'] = new_child_items  # Update child items
 
-            # Update epic items to include both stories and standalone tasks
-            epic['items'] = stories + standalone_tasks
-            processed_epics.append(epic)
+            # Any remaining tasks that weren't matched to a parent stay standalone,
+            # epic items become the stories followed by those tasks
+            stories.extend(task_map.values())
+            epic['items'] = stories
 
-        return processed_epics
+        return epics
 
 class JiraIntegrator:
 
@@ -275,12 +393,41 @@ class JiraIntegrator:
             basic_auth=(username, password)
         )
         self.project_key = project_key
+        # Shared by every issue payload, the jira client never mutates nested field dicts
+        self.project_field = {'key': project_key}
+        # Concurrent calls share the session, size its pool so they do not queue for a connection
+        # and retry throttled or unavailable responses at the transport level
+        self.jira._session.mount("https://", HTTPAdapter(
+            pool_connections=JIRA_POOL_SIZE,
+            pool_maxsize=JIRA_POOL_SIZE,
+            max_retries=Retry(
+                total=8,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # Idempotent methods only, a replayed POST could create a duplicate issue
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                respect_retry_after_header=True
+            )
+        ))
+        # Cleared when the instance rejects /issue/bulk, issues are then created one by one
+        self.bulk_create_supported = True
+        # Issues queued by create_issue_batched, sent in bulk when full or after JIRA_BATCH_MAX_WAIT
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_timer = None
+        self._flush_at_exit = False
+        # Jira account ids already looked up, keyed by email (None when no user was found)
+        self._user_cache: Dict[str, Optional[str]] = {}
 
     # Function to get transition ID from status name
     def get_transition_id(self, issue_key, target_status):
+        if not target_status:
+            return None
         transitions = self.jira.transitions(issue_key)
+        target_status = target_status.lower()
         for transition in transitions:
-            if transition['to']['name'].lower() == target_status.lower():
+            if transition['to']['name'].lower() == target_status:
                 return transition['id']
         return None
 
@@ -289,9 +436,9 @@ class JiraIntegrator:
         transition_id = self.get_transition_id(issue_key, target_status)
         if transition_id:
             self.jira.transition_issue(issue_key, transition_id)
-            print(f"Issue {issue_key} transitioned to {target_status}.")
+            logger.info(f"Issue {issue_key} transitioned to {target_status}.")
         else:
-            print(f"Error: No transition found for status '{target_status}'.")
+            logger.error(f"No transition found for status '{target_status}'.")
 
     def find_jira_user(self, email: str) -> Optional[str]:
         """
@@ -301,97 +448,291 @@ class JiraIntegrator:
         Returns:
             Optional[str]: Jira username or None if not found
         """
+        if not email:
+            return None
+        if email in self._user_cache:
+            return self._user_cache[email]
+        account_id = None
         try:
-            if email:
-                # Use alternative search methods compliant with GDPR restrictions
-                user = self.jira.search_users(
-                    query=email,
-                    maxResults=1
-                )
-                if user:
-                    return user[0].accountId
-            else:
-                return None 
-        except Exception as e:
+            # Use alternative search methods compliant with GDPR restrictions
+            user = self.jira.search_users(
+                query=email,
+                maxResults=1
+            )
+            if user:
+                account_id = user[0].accountId
+        except JIRAError as e:
             logger.error(f"GDPR-compliant user search error: {e}")
-            return None
+        # Misses and failed searches are cached too, so they are not retried for every issue
+        self._user_cache[email] = account_id
+        return account_id
         
+    def prefetch_users(self, emails):
+        """
+        Warm the user cache for the given emails before any issue is created.
+        Args:
+            emails (Iterable[str]): User emails to resolve
+        """
+        # Each email is a separate search, the distinct set is resolved concurrently
+        pending = [email for email in set(emails) if email and email not in self._user_cache]
+        with ThreadPoolExecutor(max_workers=JIRA_MAX_WORKERS) as executor:
+            list(executor.map(self.find_jira_user, pending))
+        resolved = sum(1 for account_id in self._user_cache.values() if account_id)
+        logger.info(f"Resolved {resolved} Jira users ahead of issue creation.")
+
     def add_users_fields(self, target_dict, source_dict, incl_assignee=False, incl_reporter=False):
-        if incl_assignee:
-            assignee: dict = {}
-            if source_dict.get('assignee') is not None:
-                assignee = self.find_jira_user(
-                    source_dict.get('assignee', "")
-                )
+        if not (incl_assignee or incl_reporter):
+            return
+        # Empty emails never resolve to a Jira user, skip the lookup entirely
+        if incl_assignee and source_dict.get('assignee'):
+            assignee = self.find_jira_user(source_dict['assignee'])
             if assignee:
                 target_dict['assignee'] = {'accountId': assignee}
-        if incl_reporter:
-            reporter: dict = {}
-            if source_dict.get('reported_by') is not None and source_dict['reported_by']:
-                reporter = self.find_jira_user(
-                    source_dict.get('reported_by', "")
-                )
+        if incl_reporter and source_dict.get('reported_by'):
+            reporter = self.find_jira_user(source_dict['reported_by'])
             if reporter:
                 target_dict['reporter'] = {'accountId': reporter}
 
-    def create_epic(self, epic_data):
+    def epic_fields(self, epic_data):
 
         epic_issue_dict = {
-            'project': {'key': self.project_key},
+            'project': self.project_field,
             'summary': epic_data['summary'],
-            'description': epic_data['description'] or 'Epic created from Notion',
-            'issuetype': {'name': epic_data['type']},
+            'description': epic_data['description'] or DEFAULT_EPIC_DESC,
+            'issuetype': issue_type_field(epic_data['type']),
         }
         # Add assignee and reporter if exists
         self.add_users_fields(epic_issue_dict, epic_data, incl_assignee=True, incl_reporter=False)
+        return epic_issue_dict
+
+    def create_epic(self, epic_data):
+        epic_issue_dict = self.epic_fields(epic_data)
         epic = self.jira.create_issue(**epic_issue_dict)
         logger.info(f"Epic `{epic_issue_dict['summary']}` Created in Jira with key {epic.key}")
         return epic.key
+
+    def create_hierarchy(self, epics):
+        """
+        Create Epics, their Tasks and the Tasks' Sub-tasks level by level, so that
+        each level goes out in as few bulk requests as possible.
+        Args:
+            epics (list): Epic dictionaries from HierarchicalDataParser
+        """
+        created_epics = self.create_issues_bulk([self.epic_fields(epic_data) for epic_data in epics], epics)
+        self.create_tasks([(epic.key, epic_data['items']) for epic_data, epic in created_epics])
     
+    def create_issues_bulk(self, field_list, items):
+        """
+        Create issues through the bulk endpoint, JIRA_BULK_CREATE_LIMIT issues per request.
+        Args:
+            field_list (list): Issue field dicts to create
+            items (list): Source items, in the same order as field_list
+        Returns:
+            list: (item, issue) pairs for the issues that were created
+        """
+        created = []
+        results = []
+        # Results come back in request order, items are correlated with them by position
+        for start in range(0, len(field_list), JIRA_BULK_CREATE_LIMIT):
+            results.extend(self.create_issues_batch(field_list[start:start + JIRA_BULK_CREATE_LIMIT]))
+        for item, result in zip(items, results):
+            if result['status'] != 'Success':
+                logger.error(f"{item['type']} `{item['summary']}` could not be created in Jira: {result['error']}")
+                continue
+            logger.info(f"{item['type']} `{item['summary']}` Created in Jira with key {result['issue'].key}")
+            created.append((item, result['issue']))
+        return created
+
+    def create_issues_batch(self, batch, parallel=True):
+        """
+        Create one batch of issues, in parallel single creates when the bulk endpoint is unavailable.
+        Args:
+            batch (list): Issue field dicts, at most JIRA_BULK_CREATE_LIMIT
+            parallel (bool): Run the single creates on a thread pool, False creates them on the calling thread
+        Returns:
+            list: create_issues style result dicts, in the order of batch
+        """
+        if self.bulk_create_supported:
+            try:
+                # The returned keys are all we need, skip fetching every created issue back
+                return self.jira.create_issues(field_list=batch, prefetch=False)
+            except JIRAError as e:
+                # Some Data Center instances disable /issue/bulk, nothing was created in that case
+                if e.status_code not in (404, 405):
+                    raise
+                logger.warning(f"Jira bulk issue creation unavailable ({e.status_code}), creating issues individually.")
+                self.bulk_create_supported = False
+        if not parallel:
+            return [self.create_issue_result(fields) for fields in batch]
+        with ThreadPoolExecutor(max_workers=JIRA_MAX_WORKERS) as executor:
+            return list(executor.map(self.create_issue_result, batch))
+
+    def create_issue_batched(self, fields):
+        """
+        Queue a single issue for bulk creation. The queue is sent once JIRA_BULK_CREATE_LIMIT
+        issues are pending, or JIRA_BATCH_MAX_WAIT seconds after the first one was queued.
+        Args:
+            fields (dict): Issue fields, as passed to create_issues
+        Returns:
+            Future: Resolves to the create_issues style result dict of this issue
+        """
+        future = Future()
+        with self._pending_lock:
+            self._pending.append((fields, future))
+            if not self._flush_at_exit:
+                # Only instances that actually queue issues need to be kept around until exit
+                atexit.register(self.flush_pending, parallel=False)
+                self._flush_at_exit = True
+            full = len(self._pending) >= JIRA_BULK_CREATE_LIMIT
+            if not full and self._flush_timer is None:
+                self._flush_timer = threading.Timer(JIRA_BATCH_MAX_WAIT, self.flush_pending)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        if full:
+            self.flush_pending()
+        return future
+
+    def flush_pending(self, parallel=True):
+        """
+        Send the issues queued by create_issue_batched right away
+        Args:
+            parallel (bool): Passed to create_issues_batch, False at interpreter exit where no new threads can be started
+        """
+        # Held for the whole send, so the exit hook waits for a flush the timer already started
+        with self._flush_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, []
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            # Other threads may have queued more issues before the lock was taken, keep every request within the limit
+            for start in range(0, len(pending), JIRA_BULK_CREATE_LIMIT):
+                batch = pending[start:start + JIRA_BULK_CREATE_LIMIT]
+                try:
+                    results = self.create_issues_batch([fields for fields, _ in batch], parallel=parallel)
+                except Exception as e:
+                    logger.exception(f"{len(batch)} queued issues could not be created in Jira")
+                    for _, future in batch:
+                        future.set_exception(e)
+                    continue
+                for (fields, future), result in zip(batch, results):
+                    if result['status'] != 'Success':
+                        logger.error(f"Queued issue `{fields.get('summary')}` could not be created in Jira: {result['error']}")
+                    future.set_result(result)
+
+    def create_issue_result(self, fields):
+        """Create a single issue and report it like one entry of jira.create_issues"""
+        try:
+            issue = self.jira.create_issue(fields=fields, prefetch=False)
+        except JIRAError as e:
+            return {'status': 'Error', 'issue': None, 'error': e.text, 'input_fields': fields}
+        return {'status': 'Success', 'issue': issue, 'error': None, 'input_fields': fields}
+
+    def transition_created_issue(self, item, issue):
+        """Move a freshly created issue to its Notion status"""
+        self.transition_issue(issue.key, item['status'])
+        logger.info(f"{item['type']} `{item['summary']}` status changed to `{item['status']}`")
+
     def create_task_hierarchy(self, epic_key, tasks):
+        self.create_tasks([(epic_key, tasks)])
 
-        for task_data in tasks:
-            # Create Task
-            task_issue_dict = {
-                'project': {'key': self.project_key},
-                'summary': task_data['summary'],
-                'description': task_data['description'] or 'Task created from Notion',
-                'issuetype': {'name': task_data['type']},
-                'parent': {'key': epic_key}, # Epic Link field (might vary by Jira instance)
-                # 'priority': {'name': task_data['priority'] or 'Medium'}
-            }
-            self.add_users_fields(task_issue_dict, task_data, incl_assignee=True, incl_reporter=False)
-            task = self.jira.create_issue(**task_issue_dict)
-            logger.info(f"Task `{task_issue_dict['summary']}` Created in Jira with key {task.key}")
-            self.transition_issue(task.key, task_data['status'])
-            logger.info(f"Task `{task_issue_dict['summary']}` status changed to `{task_data['status']}`")
-            # transitions = self.jira.transitions(task)
-            # for t in transitions:
-            #     print(f"id: {t['id']}, name: {t['name']}")
-            # Create Subtasks
+    def create_tasks(self, epic_tasks):
+        """
+        Create Tasks with their Sub-tasks and move all of them to their Notion status.
+        Args:
+            epic_tasks (list): (epic_key, tasks) pairs, Tasks of every Epic share the bulk requests
+        """
+        tasks = []
+        task_dicts = []
+        for epic_key, epic_items in epic_tasks:
+            epic_parent = {'key': epic_key}
+            for task_data in epic_items:
+                # Create Task
+                task_issue_dict = {
+                    'project': self.project_field,
+                    'summary': task_data['summary'],
+                    'description': task_data['description'] or DEFAULT_TASK_DESC,
+                    'issuetype': issue_type_field(task_data['type']),
+                    'parent': epic_parent, # Epic Link field (might vary by Jira instance)
+                    # 'priority': {'name': task_data['priority'] or 'Medium'}
+                }
+                self.add_users_fields(task_issue_dict, task_data, incl_assignee=True, incl_reporter=False)
+                tasks.append(task_data)
+                task_dicts.append(task_issue_dict)
+        created_tasks = self.create_issues_bulk(task_dicts, tasks)
+
+        with ThreadPoolExecutor(max_workers=JIRA_MAX_WORKERS) as executor:
+            # Transitions only need the issue key, run the Task ones while the Subtasks are created
+            transitions = [executor.submit(self.transition_created_issue, *created) for created in created_tasks]
+            created_subtasks = self.create_subtasks(created_tasks)
+            transitions += [executor.submit(self.transition_created_issue, *created) for created in created_subtasks]
+            for transition in transitions:
+                transition.result()
+
+    def create_subtasks(self, created_tasks):
+        """
+        Create the Sub-tasks of already created Tasks through the bulk endpoint.
+        Args:
+            created_tasks (list): (task_data, issue) pairs from create_issues_bulk
+        Returns:
+            list: (sub_data, issue) pairs for the Sub-tasks that were created
+        """
+        subtasks = []
+        subtask_dicts = []
+        for task_data, task in created_tasks:
+            task_parent = {'key': task.key}
             for _, sub_data in task_data.get('child_items', {}).items():
                 if isinstance(sub_data, str):
                     continue
                 sub_data['type'] = 'Sub-task'
                 subtask_issue_dict = {
-                    'project': {'key': self.project_key},
+                    'project': self.project_field,
                     'summary': sub_data['summary'],
-                    'description': sub_data['description'] or 'Sub-task created from Notion',
-                    'issuetype': {'name': sub_data['type']},
-                    'parent': {'key': task.key},
+                    'description': sub_data['description'] or DEFAULT_SUBTASK_DESC,
+                    'issuetype': SUBTASK_TYPE_FIELD,
+                    'parent': task_parent,
                     # 'priority': {'name': sub_data['priority'] or 'Medium'}
                 }
                 self.add_users_fields(subtask_issue_dict, sub_data, incl_assignee=True, incl_reporter=False)
-                sub_task = self.jira.create_issue(**subtask_issue_dict)
-                logger.info(f"Sub Task `{subtask_issue_dict['summary']}` Created in Jira with key {sub_task.key}")
-                self.transition_issue(sub_task.key, sub_data['status'])
-                logger.info(f"Task `{subtask_issue_dict['summary']}` status changed to `{sub_data['status']}`")
+                subtasks.append(sub_data)
+                subtask_dicts.append(subtask_issue_dict)
+        return self.create_issues_bulk(subtask_dicts, subtasks)
+
+def issue_type_field(name):
+    """Issue type field for an issue payload, shared for the known types"""
+    return ISSUE_TYPE_FIELDS.get(name) or {'name': name}
+
+def write_json(data, output_file):
+    """Dump data to output_file, with orjson when it is installed"""
+    if orjson is not None:
+        Path(output_file).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(output_file, "w", encoding="utf-8") as json_file:
+        json.dump(data, json_file, indent=4)
+
+def collect_assignees(epics: List[Dict]) -> set:
+    """
+    Collect the distinct assignee emails of the Epics, their items and sub-items.
+    Reporters are not sent to Jira, so they are not collected.
+    """
+    emails = set()
+    pending = list(epics)
+    while pending:
+        item = pending.pop()
+        if item.get('assignee'):
+            emails.add(item['assignee'])
+        pending.extend(item.get('items', []))
+        child_items = item.get('child_items')
+        if isinstance(child_items, dict):
+            pending.extend(child for child in child_items.values() if isinstance(child, dict))
+    return emails
 
 def main():
     parser = argparse.ArgumentParser(description="Process Notion data and upload to Jira.")
     parser.add_argument("--root", required=True, help="Root directory containing Notion export data")
     args = parser.parse_args()
 
+    setup_logging()
     root_dir = args.root
     # Obtain hierarchical data
     dataParser = HierarchicalDataParser(root_dir)
@@ -399,17 +740,13 @@ def main():
     epics = dataParser.reorganize_epic_tasks(epics)
     # Save as JSON file
     output_file = "epics_data.json"
-    with open(output_file, "w", encoding="utf-8") as json_file:
-        json.dump(epics, json_file, indent=4)
+    write_json(epics, output_file)
     
-    JIRA_SERVER_URL = os.getenv("JIRA_SERVER_URL")
-    JIRA_USERNAME = os.getenv("JIRA_USERNAME")
-    JIRA_PASSWORD = os.getenv("JIRA_TOKEN")
-    JIRA_PROJECT_KEY = os.getenv("JIRA_PROJECT_KEY")
-    jira = JiraIntegrator(JIRA_SERVER_URL, JIRA_USERNAME, JIRA_PASSWORD, JIRA_PROJECT_KEY)
-    for data in epics:
-        epic_id = jira.create_epic(data)
-        jira.create_task_hierarchy(epic_id, data['items'])
+    config = Config.from_env()
+    jira = JiraIntegrator(config.jira_server_url, config.jira_username, config.jira_token, config.jira_project_key)
+    # Resolve every distinct assignee up front so issue creation only hits the cache
+    jira.prefetch_users(collect_assignees(epics))
+    jira.create_hierarchy(epics)
     print(f"Data successfully saved to {output_file}")
 
 if __name__ == '__main__':
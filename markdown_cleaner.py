@@ -1,39 +1,49 @@
 import re
+import logging
+from pathlib import Path
+
+# Patterns compiled once, markdown_to_dict runs for every item file
+_BRACKETED_RE = re.compile(r'\s*\([^)]*\)')
+_KV_RE = re.compile(r'^\*{0,2}(.*?):\*{0,2}\s*(.*)')
+_CHILD_RE = re.compile(r'([^(]+)\s?\(([^)]+)\.md\)')
+
+DESCRIPTION_MARKER = "**Description:**"
+
+logger = logging.getLogger(__name__)
 
 def clean_bracketed_text(text):
-    return re.sub(r'\s*\([^)]*\)', '', text).strip()
+    return _BRACKETED_RE.sub('', text).strip()
+
+def clean_child_name(name):
+    """Clean a linked child task name: decode '%20' to a space and drop the ', ' list separator"""
+    return name.strip().replace('%20', ' ').lstrip(", ")
 
 def markdown_to_dict(md_file):
-    with open(md_file, 'r', encoding='utf-8') as file:
-        md_content = file.read()
-        # print("File Content: ", md_content)
+    # Decode in one shot, utf-8-sig also drops a BOM if the export has one
+    md_content = Path(md_file).read_bytes().decode('utf-8-sig')
     
     sections = {}
-    content = md_content
     description = md_content
-    if md_content.find("**Description:**") > 0:
-        content = md_content.split("**Description:**")
-        description = content[1]
-    elif md_content.find("Description:\n") > 0:
-        content = md_content.split("Description:\n")
-        print("\n\n\nContent: ", content)
-        description = content[1]
-    for line in content[0].splitlines():
+    # Single pass: properties are parsed line by line until the description marker,
+    # everything after the marker is sliced off as the description
+    offset = 0
+    for line in md_content.splitlines(keepends=True):
+        marker = line.find(DESCRIPTION_MARKER)
+        if marker >= 0:
+            description = md_content[offset + marker + len(DESCRIPTION_MARKER):]
+            break
+        if line.strip() == "Description:":
+            description = md_content[offset + len(line):]
+            break
+        offset += len(line)
         # header_match = re.match(r'^(#{1,6})\s*(.*)', line)
-        key_value_match = re.match(r'^\*{0,2}(.*?):\*{0,2}\s*(.*)', line)
+        key_value_match = _KV_RE.match(line.rstrip("\r\n"))
         if key_value_match:
             key, value = key_value_match.groups()
             if key == "Child Tasks":
-                cl_pattern = r'([^(]+)\s?\(([^)]+)\.md\)'
-                print(value)
-                sections[key] = {}
-                for match in re.findall(cl_pattern, value):
-                    # Clean the name by replacing '%20' with space
-                    name = match[0].strip().replace('%20', ' ').lstrip(", ")
-                    # Extract the ID (last 32 chars)
-                    id_ = match[1][-32:]
-                
-                    sections[key][id_] = name
+                logger.debug("Child Tasks of %s: %s", md_file, value)
+                # Keyed by the page ID (last 32 chars of the linked filename)
+                sections[key] = {match.group(2)[-32:]: clean_child_name(match.group(1)) for match in _CHILD_RE.finditer(value)}
             else:
                 sections[key] = value
 